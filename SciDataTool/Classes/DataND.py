@@ -80,6 +80,11 @@ try:
 except ImportError as error:
     compare_phase_along = error
 
+try:
+    from ..Methods.DataND.compute_plot_data import compute_plot_data
+except ImportError as error:
+    compute_plot_data = error
+
 try:
     from ..Methods.DataND.export_along import export_along
 except ImportError as error:
@@ -301,6 +306,18 @@ class DataND(Data):
         )
     else:
         compare_phase_along = compare_phase_along
+    # cf Methods.DataND.compute_plot_data
+    if isinstance(compute_plot_data, ImportError):
+        compute_plot_data = property(
+            fget=lambda x: raise_(
+                ImportError(
+                    "Can't use DataND method compute_plot_data: "
+                    + str(compute_plot_data)
+                )
+            )
+        )
+    else:
+        compute_plot_data = compute_plot_data
     # cf Methods.DataND.export_along
     if isinstance(export_along, ImportError):
         export_along = property(
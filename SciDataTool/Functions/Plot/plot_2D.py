@@ -194,7 +194,7 @@ def plot_2D(
             )
         if xticks is not None:
             ax.xaxis.set_ticks(xticks)
-            plt.xticks(rotation=90, ha="center", va="top")
+            plt.setp(ax.get_xticklabels(), rotation=90, ha="center", va="top")
         if xticklabels is not None:
             if is_indlabels:
                 ax.set_xticklabels(
@@ -232,7 +232,7 @@ def plot_2D(
 
         if xticks is not None:
             ax.xaxis.set_ticks(xticks)
-            plt.xticks(rotation=90, ha="center", va="top")
+            plt.setp(ax.get_xticklabels(), rotation=90, ha="center", va="top")
         if xticklabels is not None:
             ax.set_xticklabels(xticklabels, rotation=90)
 
@@ -258,8 +258,8 @@ def plot_2D(
                     label=legend_list[i],
                     picker=True,
                 )
-        plt.xticks(
-            range(len(Xdatas[i_Xdatas[i]])),
+        ax.set_xticks(range(len(Xdatas[i_Xdatas[i]])))
+        ax.set_xticklabels(
             ["{:.2f}".format(f) for f in Xdatas[i_Xdatas[i]]],
             rotation=90,
         )
@@ -277,8 +277,8 @@ def plot_2D(
                 label=legend_list[i],
                 picker=True,
             )
-        plt.xticks(
-            range(len(Xdatas[i_Xdatas[i]])),
+        ax.set_xticks(range(len(Xdatas[i_Xdatas[i]])))
+        ax.set_xticklabels(
             [f"{f:g}" for f in Xdatas[i_Xdatas[i]]],
             rotation=90,
         )
@@ -329,7 +329,7 @@ def plot_2D(
             )
         if xticks is not None:
             ax.xaxis.set_ticks(xticks)
-            plt.xticks(rotation=90, ha="center", va="top")
+            plt.setp(ax.get_xticklabels(), rotation=90, ha="center", va="top")
         if xticklabels is not None:
             if is_indlabels:
                 ax.set_xticklabels(
@@ -356,7 +356,7 @@ def plot_2D(
             )
         if xticks is not None:
             ax.xaxis.set_ticks(xticks)
-            plt.xticks(rotation=90, ha="center", va="top")
+            plt.setp(ax.get_xticklabels(), rotation=90, ha="center", va="top")
         if xticklabels is not None:
             if is_indlabels:
                 ax.set_xticklabels(
@@ -407,7 +407,7 @@ def plot_2D(
         ax.legend()
 
         if xticks is None:
-            plt.xticks([])
+            ax.set_xticks([])
 
     ax.set_xlabel(xlabel)
     ax.set_ylabel(ylabel)
@@ -473,12 +473,12 @@ def plot_2D(
     if save_path is not None:
         save_path = save_path.replace("\\", "/")
         fig.savefig(save_path)
-        plt.close()
+        plt.close(fig)
 
     if is_show_fig:
         fig.show()
 
     if win_title:
-        manager = plt.get_current_fig_manager()
+        manager = getattr(fig.canvas, "manager", None)
         if manager is not None:
             manager.set_window_title(win_title)
@@ -1,4 +1,4 @@
-from numpy import nanmin as np_min, nanmax as np_max, abs as np_abs, log10
+from numpy import nanmin as np_min, nanmax as np_max, abs as np_abs, log10, clip
 
 import matplotlib.pyplot as plt
 import mpl_toolkits.mplot3d.art3d as art3d
@@ -177,7 +177,7 @@ def plot_3D(
         ax.zaxis.labelpad = 5
         if xticks is not None:
             ax.xaxis.set_ticks(xticks)
-            plt.xticks(rotation=90, ha="center", va="top")
+            plt.setp(ax.get_xticklabels(), rotation=90, ha="center", va="top")
         if yticks is not None:
             ax.yaxis.set_ticks(yticks)
         if xticklabels is not None:
@@ -205,7 +205,7 @@ def plot_3D(
         ax.zaxis.labelpad = 5
         if xticks is not None:
             ax.xaxis.set_ticks(xticks)
-            plt.xticks(rotation=90, ha="center", va="top")
+            plt.setp(ax.get_xticklabels(), rotation=90, ha="center", va="top")
         if yticks is not None:
             ax.yaxis.set_ticks(yticks)
         if xticklabels is not None:
@@ -222,8 +222,12 @@ def plot_3D(
         if is_logscale_z:
             ax.zscale("log")
     elif type_plot == "pcolor":
-        Zdata[Zdata < z_min] = z_min
-        Zdata[Zdata > z_max] = z_max
+        # Not in place to keep the input data unchanged
+        # (bounds of the dtype of the field so that float32 is not upcast)
+        if Zdata.dtype.kind == "f":
+            Zdata = clip(Zdata, Zdata.dtype.type(z_min), Zdata.dtype.type(z_max))
+        else:
+            Zdata = clip(Zdata, z_min, z_max)
         # Handle descending order axes (e.g. spectrogram of run-down in freq/rpm map)
         if Ydata[-1] < Ydata[0]:
             Ydata = Ydata[::-1]
@@ -250,7 +254,7 @@ def plot_3D(
             l.set_family(font_name)
         if xticks is not None:
             ax.xaxis.set_ticks(xticks)
-            plt.xticks(rotation=90, ha="center", va="top")
+            plt.setp(ax.get_xticklabels(), rotation=90, ha="center", va="top")
         if yticks is not None:
             ax.yaxis.set_ticks(yticks)
         if xticklabels is not None:
@@ -282,7 +286,7 @@ def plot_3D(
             l.set_family(font_name)
         if xticks is not None:
             ax.xaxis.set_ticks(xticks)
-            plt.xticks(rotation=90, ha="center", va="top")
+            plt.setp(ax.get_xticklabels(), rotation=90, ha="center", va="top")
         if yticks is not None:
             ax.yaxis.set_ticks(yticks)
         if xticklabels is not None:
@@ -311,7 +315,7 @@ def plot_3D(
             l.set_family(font_name)
         if xticks is not None:
             ax.xaxis.set_ticks(xticks)
-            plt.xticks(rotation=90, ha="center", va="top")
+            plt.setp(ax.get_xticklabels(), rotation=90, ha="center", va="top")
         if yticks is not None:
             ax.yaxis.set_ticks(yticks)
         if xticklabels is not None:
@@ -353,12 +357,12 @@ def plot_3D(
     if save_path is not None:
         save_path = save_path.replace("\\", "/")
         fig.savefig(save_path)
-        plt.close()
+        plt.close(fig)
 
     if is_show_fig:
         fig.show()
 
     if win_title:
-        manager = plt.get_current_fig_manager()
+        manager = getattr(fig.canvas, "manager", None)
         if manager is not None:
             manager.set_window_title(win_title)
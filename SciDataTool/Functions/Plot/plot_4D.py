@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 
-from numpy import log10, abs as np_abs, nanmax as np_max, NaN, zeros_like
+from numpy import log10, abs as np_abs, nanmax as np_max, NaN, zeros_like, where
 import matplotlib.pyplot as plt
 
 from SciDataTool.Functions.Plot.init_fig import init_fig
@@ -156,7 +156,8 @@ def plot_4D(
         else:
             z_min = z_max / 1e4
 
-    Zdata[Zdata < z_min] = NaN
+    # Not in place to keep the input data unchanged
+    Zdata = where(Zdata < z_min, NaN, Zdata)
 
     if is_same_size:
         Sdata = zeros_like(Zdata)
@@ -201,7 +202,7 @@ def plot_4D(
             l.set_family(font_name)
         if xticks is not None:
             ax.xaxis.set_ticks(xticks)
-            plt.xticks(rotation=90, ha="center", va="top")
+            plt.setp(ax.get_xticklabels(), rotation=90, ha="center", va="top")
         if xticklabels is not None:
             ax.set_xticklabels(xticklabels, rotation=90)
         if yticks is not None:
@@ -230,7 +231,7 @@ def plot_4D(
         )
         if xticks is not None:
             ax.xaxis.set_ticks(xticks)
-            plt.xticks(rotation=90, ha="center", va="top")
+            plt.setp(ax.get_xticklabels(), rotation=90, ha="center", va="top")
         if xticklabels is not None:
             ax.set_xticklabels(xticklabels, rotation=90)
         if yticks is not None:
@@ -287,12 +288,12 @@ def plot_4D(
     if save_path is not None:
         save_path = save_path.replace("\\", "/")
         fig.savefig(save_path)
-        plt.close()
+        plt.close(fig)
 
     if is_show_fig:
         fig.show()
 
     if win_title:
-        manager = plt.get_current_fig_manager()
+        manager = getattr(fig.canvas, "manager", None)
         if manager is not None:
             manager.set_window_title(win_title)
@@ -4,17 +4,17 @@ from numpy import (
     exp,
     ceil,
     isin,
-    take,
-    insert,
-    delete,
     allclose,
     real,
     linspace,
     where,
     isclose,
     around,
+    iscomplexobj,
+    result_type,
+    float64,
 )
-from numpy.fft import (
+from scipy.fft import (
     fftshift,
     ifftshift,
     rfftn,
@@ -274,8 +274,13 @@ def comp_fftn(values, axes_list, is_real=True):
                     axes = [axis.index] + axes
                     shape = [values.shape[axis.index]] + shape
     if axes != []:
+        # Double precision as numpy.fft (scipy.fft keeps float32/complex64)
+        values = values.astype(result_type(values.dtype, float64), copy=False)
         size = array(shape).prod()
         if is_onereal:
+            if iscomplexobj(values):
+                # scipy rfftn does not accept complex input (numpy discarded the imaginary part)
+                values = real(values)
             values_FT = rfftn(values, axes=axes)
             # Do not multiply constant component by 2 (f=0)
             if axes_list[axes[-1]].corr_values is not None:
@@ -283,21 +288,18 @@ def comp_fftn(values, axes_list, is_real=True):
             else:
                 freqs = axes_list[axes[-1]].values
             if freqs[0] == 0:
-                slice_0 = take(values_FT, 0, axis=axes[-1])
-                slice_0 *= 0.5
+                # Scale the first slice in place (values_FT is a new array)
+                slice_0 = (slice(None),) * axes[-1] + (0,)
+                values_FT[slice_0] *= 0.5
                 if is_twice:
-                    slice_0 *= 0.5
-                other_values = delete(values_FT, 0, axis=axes[-1])
-                values_FT = insert(other_values, 0, slice_0, axis=axes[-1])
+                    values_FT[slice_0] *= 0.5
             values_FT2 = 2.0 * fftshift(values_FT, axes=axes[:-1]) / size
             if is_twice:
                 values_FT2 *= 2.0
         elif is_twice:
             values_FT = fftn(values, axes=axes)
-            slice_0 = take(values_FT, 0, axis=axes[-1])
-            slice_0 *= 0.5
-            other_values = delete(values_FT, 0, axis=axes[-1])
-            values_FT = insert(other_values, 0, slice_0, axis=axes[-1])
+            slice_0 = (slice(None),) * axes[-1] + (0,)
+            values_FT[slice_0] *= 0.5
             values_FT2 = 2.0 * fftshift(values_FT, axes=axes) / size
         else:
             values_FT = fftn(values, axes=axes)
@@ -417,26 +419,25 @@ def comp_ifftn(values, axes_list, is_real=True):
                 axes = [axis.index] + axes
                 shape = [values.shape[axis.index]] + shape
     if axes:  # Check if ifftn has to be called
+        # Double precision as numpy.fft (scipy.fft keeps float32/complex64)
+        values = values.astype(result_type(values.dtype, float64), copy=False)
         size = array(shape).prod()
         if is_onereal:
             values = values * size / 2
             if is_half:
                 values *= 0.5
-            values_shift = ifftshift(values, axes=axes[:-1])
-            slice_0 = take(values_shift, 0, axis=axes[-1])
-            slice_0 *= 2
+            values = ifftshift(values, axes=axes[:-1])
+            # Scale the first slice in place (values is a new array)
+            slice_0 = (slice(None),) * axes[-1] + (0,)
+            values[slice_0] *= 2
             if is_half:
-                slice_0 *= 2
-            other_values = delete(values_shift, 0, axis=axes[-1])
-            values = insert(other_values, 0, slice_0, axis=axes[-1])
+                values[slice_0] *= 2
             values_IFT = irfftn(values, axes=axes)
         elif is_half:
             values = values * size / 2
-            values_shift = ifftshift(values, axes=axes[:-1])
-            slice_0 = take(values_shift, 0, axis=axes[-1])
-            slice_0 *= 2
-            other_values = delete(values_shift, 0, axis=axes[-1])
-            values = insert(other_values, 0, slice_0, axis=axes[-1])
+            values = ifftshift(values, axes=axes[:-1])
+            slice_0 = (slice(None),) * axes[-1] + (0,)
+            values[slice_0] *= 2
             values_IFT = ifftn(values, axes=axes)
         else:
             values_shift = ifftshift(values, axes=axes) * size
@@ -6,7 +6,6 @@ from numpy import (
     concatenate,
     identity,
     arange,
-    asarray,
     sin,
     pi,
     outer,
@@ -42,7 +41,9 @@ def comp_DST(n: int) -> ndarray:
     return DST
 
 
-def comp_undersampling(K: float, Time: Data1D, seed: int = 42) -> ndarray:
+def comp_undersampling(
+    K: float, Time: Data1D, seed: int = 42, rng: np.random.Generator = None
+) -> ndarray:
     """
     Compute an undersampled Data1D object with a percentage K of the initial samples
 
@@ -51,6 +52,7 @@ def comp_undersampling(K: float, Time: Data1D, seed: int = 42) -> ndarray:
     K: 0 <= K <= 1
     Time: Data1D object which is undersample
     seed: integer used to initialize the numpy's random generator
+    rng: numpy Generator to draw the samples from (seed is not used if given)
 
     Returns:
     M: ndarray containing the indices of the observed samples of Time
@@ -62,10 +64,15 @@ def comp_undersampling(K: float, Time: Data1D, seed: int = 42) -> ndarray:
     n = len(Time.values)
     m = floor(K * n)
 
-    np.random.seed(seed)
-    M = np.random.choice(n, m, replace=False)
+    if rng is None:
+        # Local generator: same indices as the seeded global one, without changing its state
+        M = np.random.RandomState(seed).choice(n, m, replace=False)
+    elif m > n / 2:
+        # Most of the samples are kept: head of a permutation
+        M = rng.permutation(n)[:m]
+    else:
+        M = rng.choice(n, m, replace=False, shuffle=False)
     M.sort()
-    M = asarray(M)
 
     time_under = Time.values[M]
 
@@ -116,9 +123,17 @@ def comp_undersampled_axe(Time: Data1D, Time_under: Data1D) -> ndarray:
     time_under = Time_under.values
     time = Time.values
 
-    # Element wise comparison and selection of indices
-    M = np.arange(len(time))
-    M = M[np.isin(time, time_under)]
+    # Binary search of the undersampled values: same (sorted, unique) indices as isin
+    # only if both vectors are strictly increasing and all the values are found
+    is_search = np.all(np.diff(time) > 0) and np.all(np.diff(time_under) > 0)
+    if is_search:
+        M = np.searchsorted(time, time_under)
+        is_search = np.all(M < len(time)) and np.array_equal(time[M], time_under)
+
+    # Element wise comparison and selection of indices otherwise
+    if not is_search:
+        M = np.arange(len(time))
+        M = M[np.isin(time, time_under)]
 
     return M
 
@@ -131,6 +146,7 @@ def omp(
     precompute: bool = True,
     dictionary=None,
     return_path: bool = False,
+    out: ndarray = None,
 ) -> ndarray:
     """
     Given Y of shape (len(M),n_targets), recover n_targets signals (of length len(M)) with joint sparsity.
@@ -144,14 +160,25 @@ def omp(
     n_coefs: passed to n_nonzero_coefs, a parameter of orthogonal_mp. It's the number of atoms
     of the dictionary used to decomposed the signals. If None set to 10% of n.
     precompute: whether to precompute. Improves performance for large Y.
+    out: ndarray of shape (n,n_targets) (or (n,) if Y is 1D) in which the recovered signals are written
+    (and returned). If None, a new array is allocated. Not compatible with return_path.
 
     Returns:
-    Y_full: ndarray (n,n_targets) matrix of the recovered signals
+    Y_full: ndarray (n,n_targets) matrix of the recovered signals (out if given)
 
     """
 
+    if out is not None:
+        if return_path:
+            raise ValueError("out is not compatible with return_path")
+        if out.shape != (n,) + Y.shape[1:]:
+            raise ValueError(
+                f"out must be of shape {(n,) + Y.shape[1:]}, got {out.shape}"
+            )
+
     if dictionary is None:
         dictionary_decomp = comp_dictionary(n, M)
+        dictionary_synth = comp_dictionary(n, arange(n))
     else:
         dictionary_decomp = dictionary[0]
         dictionary_synth = dictionary[1]
@@ -172,9 +199,7 @@ def omp(
             X=dictionary_decomp, y=Y, n_nonzero_coefs=n_coefs, precompute=precompute
         )
 
-    dictionary_synth = comp_dictionary(n, arange(n))
-
-    Y_full = dictionary_synth @ sparse_decomposition
+    Y_full = np.matmul(dictionary_synth, sparse_decomposition, out=out)
 
     if return_path:
         return Y_full, n_iters
@@ -1,6 +1,10 @@
-from PySide2.QtWidgets import QWidget
+from functools import lru_cache
+from weakref import ref
+from os import cpu_count
+from scipy.fft import set_workers
+from PySide2.QtWidgets import QWidget, QLabel
 from SciDataTool.Functions import parser
-from PySide2.QtCore import Qt
+from PySide2.QtCore import Qt, QTimer, QObject, QRunnable, QThreadPool, Signal
 from SciDataTool.GUI.DDataPlotter.Ui_DDataPlotter import Ui_DDataPlotter
 from matplotlib.backends.backend_qt5agg import (
     FigureCanvas,
@@ -11,7 +15,8 @@ from matplotlib.lines import Line2D
 from matplotlib.patches import Rectangle
 from matplotlib.collections import PathCollection, QuadMesh
 from matplotlib.text import Annotation
-from numpy import array
+from matplotlib.colors import to_hex
+from numpy import empty, float32, ndarray
 from SciDataTool.Functions.Plot import ifft_dict, fft_dict
 from SciDataTool.Functions.Plot import TEXT_BOX
 
@@ -31,23 +36,115 @@ SYMBOL_DICT = {
     "reference torque": "T_{ref}",
 }
 
-PARAM_3D = [
-    "is_2D_view",
-    "is_contour",
-    "is_same_size",
-    "N_stem",
-    "colormap",
-    "annotation_delim",
-    "marker_color",
-]
-
-PARAM_2D = [
-    "color_list",
-    "data_list",
-    "legend_list",
-    "fund_harm_dict",
-    "is_show_legend",
-]
+PARAM_3D = frozenset(
+    {
+        "is_2D_view",
+        "is_contour",
+        "is_same_size",
+        "N_stem",
+        "colormap",
+        "annotation_delim",
+        "marker_color",
+    }
+)
+
+PARAM_2D = frozenset(
+    {
+        "color_list",
+        "data_list",
+        "legend_list",
+        "fund_harm_dict",
+        "is_show_legend",
+    }
+)
+
+# Number of plots for which the computed data is kept
+N_PLOT_CACHE = 8
+
+# Parameters of the plot used by compute_plot_data
+PARAM_COMPUTE_2D = ["axis_data", "is_norm", "data_list", "type_plot"]
+
+PARAM_COMPUTE_3D = ["axis_data", "is_norm", "is_2D_view", "N_stem"]
+
+
+@lru_cache(maxsize=128)
+def parse_axes(axes_selected):
+    """Parse the axes strings selected in the UI (cached as they are immutable)
+
+    Parameters
+    ----------
+    axes_selected : tuple
+        tuple of strings describing the axes of the plot
+
+    Returns
+    -------
+    list of RequestedAxis (read only)
+    """
+    return parser.read_input_strings(axes_selected, axis_data=None)
+
+
+# Translation table removing the latex marks of the labels
+STRIP_LATEX = str.maketrans("", "", "${}")
+
+# Latex commands of the labels displayed with unicode characters in Qt
+LATEX_UNICODE = {
+    "\\alpha": "α",
+    "\\beta": "β",
+    "\\gamma": "γ",
+    "\\delta": "δ",
+    "\\Delta": "Δ",
+    "\\varphi": "φ",
+    "\\phi": "φ",
+    "\\theta": "θ",
+    "\\lambda": "λ",
+    "\\mu": "μ",
+    "\\pi": "π",
+    "\\sigma": "σ",
+    "\\tau": "τ",
+    "\\omega": "ω",
+    "\\Omega": "Ω",
+    "\\circ": "°",
+    "\\cdot": "·",
+    "\\widehat": "",
+    "\\mathdefault": "",
+}
+
+
+def strip_latex(string):
+    """format a latex string for a Qt label (plain text)"""
+    if "\\" in string:
+        for command, char in LATEX_UNICODE.items():
+            string = string.replace(command, char)
+    return string.translate(STRIP_LATEX)
+
+
+def to_hashable(value):
+    """Convert the info of a plot to an exact hashable key (repr truncates the arrays)
+
+    Parameters
+    ----------
+    value : object
+        value to convert (array, list, tuple, dict, scalar or any object)
+
+    Returns
+    -------
+    key : tuple or scalar
+        hashable key, equal only for identical values (objects are compared by identity)
+    """
+    if isinstance(value, ndarray):
+        return ("ndarray", value.dtype.str, value.shape, value.tobytes())
+    elif isinstance(value, (list, tuple)):
+        return (type(value).__name__, tuple(to_hashable(v) for v in value))
+    elif isinstance(value, dict):
+        return ("dict", tuple((k, to_hashable(v)) for k, v in value.items()))
+    elif value is None or isinstance(value, (str, bool, int, float, complex)):
+        return (type(value).__name__, value)
+    else:
+        try:
+            hash(value)
+        except TypeError:
+            return ("id", id(value))
+        return (type(value).__name__, value)
 
 
 def latex(string):
@@ -57,6 +154,57 @@ def latex(string):
     return string
 
 
+class PlotWorkerSignals(QObject):
+    """Signals of the PlotWorker (a QRunnable can't emit signals)"""
+
+    finished = Signal(int, object)
+
+
+class PlotWorker(QRunnable):
+    """Compute the data to plot in a thread of the QThreadPool (no matplotlib call)"""
+
+    def __init__(self, job_id, data, arg_list, compute_kwargs, get_job_id):
+        """Initialize the worker
+
+        Parameters
+        ----------
+        self : PlotWorker
+            a PlotWorker object
+        job_id : int
+            id of the plot request
+        data : DataND
+            DataND object to plot
+        arg_list : list
+            list of strings with the axes and the operations of the plot
+        compute_kwargs : dict
+            arguments of compute_plot_data
+        get_job_id : function
+            returns the id of the last plot requested (to skip the outdated requests)
+        """
+        QRunnable.__init__(self)
+        self.signals = PlotWorkerSignals()
+        self.job_id = job_id
+        self.data = data
+        self.arg_list = arg_list
+        self.compute_kwargs = compute_kwargs
+        self.get_job_id = get_job_id
+
+    def run(self):
+        """Compute the data and send it to the main thread"""
+        # A newer plot was requested while this one was waiting in the pool
+        if self.get_job_id() != self.job_id:
+            return
+        try:
+            with set_workers(cpu_count()):
+                result_list = self.data.compute_plot_data(
+                    *self.arg_list, **self.compute_kwargs
+                )
+        except Exception:
+            # The plot method computes the data again to raise the error in the main thread
+            result_list = None
+        self.signals.finished.emit(self.job_id, result_list)
+
+
 class DDataPlotter(Ui_DDataPlotter, QWidget):
     """Main window of the SciDataTool UI"""
 
@@ -71,6 +219,7 @@ class DDataPlotter(Ui_DDataPlotter, QWidget):
         is_auto_refresh=False,
         frozen_type=0,
         plot_arg_dict=dict(),
+        is_cursor=True,
     ):
         """Initialize the UI according to the input given by the user
 
@@ -96,6 +245,8 @@ class DDataPlotter(Ui_DDataPlotter, QWidget):
             Dictionnary with arguments that must be given to the plot
         frozen_type : int
             0 to let the user modify the axis of the plot, 1 to let him switch them, 2 to not let him change them, 3 to freeze both axes and operations
+        is_cursor : bool
+            True to display a cursor on the point picked by the user
         """
 
         # Build the interface according to the .ui file
@@ -108,12 +259,51 @@ class DDataPlotter(Ui_DDataPlotter, QWidget):
         else:
             self.is_auto_refresh.setCheckState(Qt.Unchecked)
 
+        # Default view of the 3D plots (new dict to keep the argument unchanged)
+        if "is_2D_view" not in plot_arg_dict:
+            plot_arg_dict = dict(plot_arg_dict, is_2D_view=True)
         self.plot_arg_dict = plot_arg_dict
         self.data = data
 
         # Initializing the figure inside the UI
         (self.fig, self.ax, _, _) = init_fig()
-        # self.set_figure(self.fig)
+
+        # Inputs of the last plot (to skip a refresh if nothing changed)
+        self._last_plot_key = None
+        self._last_plot_data = None
+        # Id of the last plot requested and inputs of the plot computed in a thread
+        self._plot_job_id = 0
+        self._plot_job = None
+        self._plot_worker = None
+        # One computation at a time (each one already uses all the cores for the FFTs)
+        self._plot_pool = QThreadPool(self)
+        self._plot_pool.setMaxThreadCount(1)
+        self._pending_plot_key = None
+        # Data computed for the last plots of the current data (key: arg_list, compute_kwargs)
+        # and weak reference to this data (no copy of the data kept alive by the cache)
+        self._plot_data_cache = dict()
+        self._plot_data_cache_ref = None
+        # Index of each axis of the last data plotted: (data, {name: index})
+        self._axes_cache = None
+
+        # Timer to throttle the cursor updates (at most one redraw every 30 ms)
+        self._pending_cursor = None
+        self._cursor_timer = QTimer(self)
+        self._cursor_timer.setSingleShot(True)
+        self._cursor_timer.setInterval(30)
+        self._cursor_timer.timeout.connect(self.update_cursor)
+
+        # Buffers reused to move the cursor circle and line
+        self._x_buf = empty(1)
+        self._y_buf = empty(1)
+        self._line_x_buf = empty(2)
+        self._line_y_buf = empty(2)
+
+        # Building the canvas and the toolbar once (only the figure is cleared at each refresh)
+        self._pick_cid = None
+        self._press_cid = None
+        self.set_figure(self.fig)
+        self.toggle_cursor(is_cursor)
 
         # Initializing the WPlotManager
         self.w_plot_manager.set_info(
@@ -127,9 +317,9 @@ class DDataPlotter(Ui_DDataPlotter, QWidget):
         )
 
         # Building the interaction with the UI itself
-        self.b_refresh.clicked.connect(self.update_plot)
+        self.b_refresh.clicked.connect(self.force_update_plot)
         self.w_plot_manager.updatePlot.connect(self.auto_update)
-        self.w_plot_manager.updatePlotForced.connect(self.update_plot)
+        self.w_plot_manager.updatePlotForced.connect(self.force_update_plot)
         self.update_plot()
 
         # Adding an argument for testing autorefresh
@@ -180,10 +370,14 @@ class DDataPlotter(Ui_DDataPlotter, QWidget):
             a DDataPlotter object
         fig : Figure
             A Figure object to put inside the UI
+        text_box : dict
+            colors of the cursor label box (fc, ec), TEXT_BOX if None
 
         """
         if text_box is None:
             text_box = TEXT_BOX
+        self.text_box = text_box
+
         # Set plot layout
         self.canvas = FigureCanvas(fig)
         self.toolbar = NavigationToolbar(self.canvas, self)
@@ -191,240 +385,415 @@ class DDataPlotter(Ui_DDataPlotter, QWidget):
         self.plot_layout.addWidget(self.toolbar)
         self.plot_layout.addWidget(self.canvas)
 
-        self.text = None
         self.circle = None
         self.line = None
 
-        # Set labels for cursor and coordinates
-        ######################################
-        def format_coord(x, y, z=None, sep=", ", ind=None):
-            # Use hidden annotations
-            annotations = [
-                child
-                for child in self.ax.get_children()
-                if isinstance(child, Annotation)
-            ]
-            X_str = None
-            if (
-                ind is not None
-                and annotations != []
-                and ind[0] in range(len(annotations))
-                and not annotations[ind[0]]._visible
-            ):
-                if annotations[ind[0]]._x == x:
-                    X_str = annotations[ind[0]]._text
-            else:
-                # Use ticklabels
-                try:
-                    x_float = float(self.ax.get_xticklabels()[-1]._text)
-                    X_str = format(x, ".4g")
-                except:
-                    for ticklabel in self.ax.get_xticklabels():
-                        if ticklabel._x == x:
-                            X_str = ticklabel._text
-                            break
-            if "mathdefault" in self.ax.get_yticklabels()[-1]._text:
-                Y_str = format(y, ".4g")
-            else:
-                try:
-                    y_float = float(self.ax.get_yticklabels()[-1]._text)
-                    Y_str = format(y, ".4g")
-                except:
-                    Y_str = None
-                    for ticklabel in self.ax.get_yticklabels():
-                        if ticklabel._y == y:
-                            Y_str = ticklabel._text
-                            break
-            if X_str is None or Y_str is None:
-                return ""
-
-            # Recovering the input of the user
-            [
-                self.data,
-                axes_selected,
-                _,
-                output_range,
-            ] = self.w_plot_manager.get_plot_info()
-
-            # Checking if the axes are following the order inside the data object
-            axes_selected_parsed = parser.read_input_strings(
-                axes_selected, axis_data=None
+        # Label of the cursor displayed by Qt on top of the canvas (not rendered by Agg)
+        self.cursor_label = QLabel(self.canvas)
+        self.cursor_label.setStyleSheet(
+            "background: "
+            + to_hex(text_box.get("fc", "w"))
+            + "; border: 1px solid "
+            + to_hex(text_box.get("ec", "k"))
+            + "; border-radius: 4px; padding: 2px;"
+        )
+        self.cursor_label.setTextFormat(Qt.PlainText)
+        # Clicks on the label are handled by the canvas
+        self.cursor_label.setAttribute(Qt.WA_TransparentForMouseEvents)
+        self.cursor_label.hide()
+        self._cursor_pos = None
+
+        # Background of the Axes without the cursor (to blit the line and circle)
+        self._bg = None
+
+        self.ax.format_coord = self.format_coord
+        self.canvas.mpl_connect("draw_event", self.on_draw)
+        self.canvas.mpl_connect("resize_event", self.reset_background)
+
+    def toggle_cursor(self, is_on):
+        """Method that connect/disconnect the cursor callbacks (no callback on
+        click/pick when the cursor is disabled)
+
+        Parameters
+        ----------
+        self : DDataPlotter
+            a DDataPlotter object
+        is_on : bool
+            True to enable the cursor
+        """
+        if is_on and self._pick_cid is None:
+            self._pick_cid = self.canvas.mpl_connect("pick_event", self.set_cursor)
+            self._press_cid = self.canvas.mpl_connect(
+                "button_press_event", self.delete_cursor
             )
+        elif not is_on and self._pick_cid is not None:
+            self.canvas.mpl_disconnect(self._pick_cid)
+            self.canvas.mpl_disconnect(self._press_cid)
+            self._pick_cid = None
+            self._press_cid = None
+            # Hide the current cursor
+            self._cursor_timer.stop()
+            self._pending_cursor = None
+            self.cursor_label.hide()
+            if self.line is not None:
+                self.line[0].set_visible(False)
+                self.circle[0].set_visible(False)
+                self.blit_cursor()
+
+    def on_draw(self, event):
+        """Method called by matplotlib once the canvas has been drawn
+
+        Parameters
+        ----------
+        self : DDataPlotter
+            a DDataPlotter object
+        event : DrawEvent
+            matplotlib draw event
+        """
+        # Draw of savefig (export dpi/renderer): the label is kept, and the background
+        # is reset as the renderer of the canvas may have been resized for the export
+        if self.canvas.is_saving() or event.canvas is not self.canvas:
+            self._bg = None
+            return
+        self.update_coord_cache()
+        # The cursor artists are animated: not included in the background
+        self._bg = self.canvas.copy_from_bbox(self.ax.bbox)
+        self.draw_cursor_artists()
+        # The label follows the point after a zoom/pan/resize
+        if self.cursor_label.isVisible():
+            self.move_cursor_label()
+
+    def reset_background(self, event=None):
+        """Method that invalidate the background used for blitting (until the next draw)
+
+        Parameters
+        ----------
+        self : DDataPlotter
+            a DDataPlotter object
+        event : ResizeEvent
+            matplotlib resize event
+        """
+        self._bg = None
+
+    def draw_cursor_artists(self):
+        """Method that draw the line and circle of the cursor (animated artists)
+
+        Parameters
+        ----------
+        self : DDataPlotter
+            a DDataPlotter object
+        """
+        if self.line is not None and self.line[0].get_visible():
+            self.ax.draw_artist(self.line[0])
+            self.ax.draw_artist(self.circle[0])
+
+    def blit_cursor(self):
+        """Method that update the cursor by blitting the line and circle over
+        the stored background (full draw if there is no background yet)
+
+        Parameters
+        ----------
+        self : DDataPlotter
+            a DDataPlotter object
+        """
+        if self._bg is None:
+            self.canvas.draw_idle()
+            return
+        self.canvas.restore_region(self._bg)
+        self.draw_cursor_artists()
+        self.canvas.blit(self.ax.bbox)
+
+    def update_coord_cache(self):
+        """Method that store the annotations and the ticklabels used by format_coord
+        (ticklabels are updated at each draw to follow zoom/pan)
+        Parameters
+        ----------
+        self : DDataPlotter
+            a DDataPlotter object
+        """
+        self._annotations = [
+            child for child in self.ax.get_children() if isinstance(child, Annotation)
+        ]
+
+        xticklabels = self.ax.get_xticklabels()
+        # Keep the first ticklabel found for each position
+        self._xtick_map = {t._x: t._text for t in reversed(xticklabels)}
+        try:
+            float(xticklabels[-1]._text)
+            self._is_xtick_float = True
+        except:
+            self._is_xtick_float = False
+
+        yticklabels = self.ax.get_yticklabels()
+        self._ytick_map = {t._y: t._text for t in reversed(yticklabels)}
+        if yticklabels != [] and "mathdefault" in yticklabels[-1]._text:
+            self._is_ytick_float = True
+        else:
+            try:
+                float(yticklabels[-1]._text)
+                self._is_ytick_float = True
+            except:
+                self._is_ytick_float = False
+
+    def format_coord(self, x, y, z=None, sep=", ", ind=None):
+        """Method that build the label of a point of the plot (status bar and cursor)
+
+        Parameters
+        ----------
+        self : DDataPlotter
+            a DDataPlotter object
+        x : float
+            x coordinate of the point
+        y : float
+            y coordinate of the point
+        z : float
+            z coordinate of the point (None for 2D plots)
+        sep : str
+            separator between the coordinates
+        ind : list
+            indices of the picked point (to use hidden annotations)
+
+        Output
+        ---------
+        string
+            label of the point
+        """
+        # Use hidden annotations
+        annotations = self._annotations
+        X_str = None
+        if (
+            ind is not None
+            and annotations != []
+            and ind[0] in range(len(annotations))
+            and not annotations[ind[0]]._visible
+        ):
+            if annotations[ind[0]]._x == x:
+                X_str = annotations[ind[0]]._text
+        # Use ticklabels
+        elif self._is_xtick_float:
+            X_str = format(x, ".4g")
+        else:
+            X_str = self._xtick_map.get(x)
+        if self._is_ytick_float:
+            Y_str = format(y, ".4g")
+        else:
+            Y_str = self._ytick_map.get(y)
+        if X_str is None or Y_str is None:
+            return ""
+
+        # Remove latex marks (labels displayed by Qt in the status bar and cursor)
+        xlabel, xunit, ylabel, yunit, zlabel, zunit = self._fmt_labels
+        X_str = strip_latex(X_str)
+        Y_str = strip_latex(Y_str)
+
+        label = f"{xlabel} = {X_str} {xunit}{sep}{ylabel} = {Y_str} {yunit}"
+
+        if z is not None:
+            label = f"{label}{sep}{zlabel} = {z:.4g} {zunit}"
+
+        return label
+
+    def set_cursor(self, event):
+        """Method that display a cursor (label, line and circle) on the point picked by the user
+
+        Parameters
+        ----------
+        self : DDataPlotter
+            a DDataPlotter object
+        event : PickEvent
+            matplotlib pick event
+        """
+        plot_obj = event.artist
+        X = None
+        Y = None
+        Z = None
+        ind = None
+        legend = None
+        if isinstance(plot_obj, Line2D):
+            ind = event.ind
+            xdata = plot_obj.get_xdata()
+            ydata = plot_obj.get_ydata()
+            X = xdata[ind][0]  # X position of the click
+            Y = ydata[ind][0]  # Y position of the click
+            if self.ax.get_legend_handles_labels()[1] != []:
+                legend = self.ax.get_legend_handles_labels()[1][
+                    self.ax.lines.index(plot_obj)
+                ]
+        elif isinstance(plot_obj, PathCollection):
+            ind = event.ind
+            X = plot_obj.get_offsets().data[ind][0][0]
+            Y = plot_obj.get_offsets().data[ind][0][1]
+            if plot_obj.get_array() is not None:
+                Z = plot_obj.get_array().data[ind][0]
+        elif isinstance(plot_obj, Rectangle):
+            X = plot_obj.get_x() + plot_obj.get_width() / 2
+            Y = plot_obj.get_height()
+        elif isinstance(plot_obj, QuadMesh):
+            ind = event.ind
+            coords = plot_obj._coordinates
+            if coords.shape[0] > 2:
+                # pcolormesh case
+                l, c = divmod(ind[0], coords.shape[1])
+                X, Y = coords[l, c + 1]
+            else:
+                X, Y = coords[:2, ind[0] + 1].mean(axis=0)
+            Z = plot_obj.get_array().data[ind[0]]
 
-            if axes_selected_parsed[0].name.lower() in SYMBOL_DICT:
-                xlabel = latex(SYMBOL_DICT[axes_selected_parsed[0].name.lower()])
+        if X is not None and Y is not None:
+            # Only the last picked point is displayed when the timer times out
+            self._pending_cursor = (X, Y, Z, ind, legend)
+            if not self._cursor_timer.isActive():
+                self._cursor_timer.start()
+
+    def update_cursor(self):
+        """Method that apply the last point picked by the user to the cursor (label, line and circle)
+
+        Parameters
+        ----------
+        self : DDataPlotter
+            a DDataPlotter object
+        """
+        if self._pending_cursor is None:
+            return
+        X, Y, Z, ind, legend = self._pending_cursor
+        self._pending_cursor = None
+
+        # Offset for the label
+        x_min, x_max = self.ax.get_xlim()
+        dx = (x_max - x_min) / 50
+        label = self.format_coord(X, Y, Z, sep="\n", ind=ind)
+        if legend is not None:
+            label = strip_latex(legend) + "\n" + label
+        if label != "":
+            if self.line is None:
+                # The line and circle are animated (blitted) and the label is a QLabel:
+                # the cursor is only displayed on screen, it is not included by savefig
+                # Draw line
+                self.line = self.ax.plot(
+                    [X, X + dx],
+                    [Y, Y],
+                    color="k",
+                    linestyle="-",
+                    linewidth=0.5,
+                    animated=True,
+                )
+                # Draw circle
+                self.circle = self.ax.plot(
+                    X,
+                    Y,
+                    ".",
+                    markerfacecolor="w",
+                    markeredgecolor="k",
+                    markeredgewidth=0.5,
+                    markersize=12,
+                    animated=True,
+                )
             else:
-                xlabel = latex(axes_selected_parsed[0].name)
-            xunit = "[" + axes_selected_parsed[0].unit + "]"
+                # Update line and circle
+                self._x_buf[0] = X
+                self._y_buf[0] = Y
+                self._line_x_buf[:] = (X, X + dx)
+                self._line_y_buf[:] = Y
+                self.circle[0].set_xdata(self._x_buf)
+                self.circle[0].set_ydata(self._y_buf)
+                self.line[0].set_xdata(self._line_x_buf)
+                self.line[0].set_ydata(self._line_y_buf)
+                self.line[0].set_visible(True)
+                self.circle[0].set_visible(True)
+
+            # Update label in box (moved by Qt, no redraw of the canvas needed)
+            self.cursor_label.setText(label)
+            self.cursor_label.adjustSize()
+            self._cursor_pos = (X + dx, Y)
+            self.move_cursor_label()
+            self.cursor_label.show()
+            self.blit_cursor()
+
+    def move_cursor_label(self):
+        """Method that place the cursor label next to the picked point
+        (the label is vertically centered on the point as the previous matplotlib text)
 
-            if len(axes_selected) == 2:
-                if axes_selected_parsed[1].name.lower() in SYMBOL_DICT:
-                    ylabel = latex(SYMBOL_DICT[axes_selected_parsed[1].name.lower()])
-                else:
-                    ylabel = latex(axes_selected_parsed[1].name)
-                yunit = "[" + latex(axes_selected_parsed[1].unit) + "]"
+        Parameters
+        ----------
+        self : DDataPlotter
+            a DDataPlotter object
+        """
+        # Display coordinates are in device pixels from the bottom left corner
+        px, py = self.ax.transData.transform(self._cursor_pos)
+        ratio = self.canvas.devicePixelRatioF()
+        self.cursor_label.move(
+            int(px / ratio),
+            int(self.canvas.height() - py / ratio - self.cursor_label.height() / 2),
+        )
 
+    def delete_cursor(self, event):
+        """Method that hide the cursor when the user right-clicks on the plot
+
+        Parameters
+        ----------
+        self : DDataPlotter
+            a DDataPlotter object
+        event : MouseEvent
+            matplotlib button press event
+        """
+        if event.button.name == "RIGHT":
+            self._cursor_timer.stop()
+            self._pending_cursor = None
+            self.cursor_label.hide()
+            if self.line is not None:
+                self.line[0].set_visible(False)
+                self.circle[0].set_visible(False)
+                self.blit_cursor()
+
+    def update_coord_labels(self, axes_selected_parsed, output_range):
+        """Method that compute the labels and units used by format_coord once per plot
+        (format_coord is called at each mouse move)
+        Parameters
+        ----------
+        self : DDataPlotter
+            a DDataPlotter object
+        axes_selected_parsed : list
+            list of RequestedAxis corresponding to the axes of the plot
+        output_range : dict
+            a dictionnary with all the info related to WDataRange
+        """
+        if axes_selected_parsed[0].name.lower() in SYMBOL_DICT:
+            xlabel = latex(SYMBOL_DICT[axes_selected_parsed[0].name.lower()])
+        else:
+            xlabel = latex(axes_selected_parsed[0].name)
+        xunit = "[" + axes_selected_parsed[0].unit + "]"
+
+        if len(axes_selected_parsed) == 2:
+            if axes_selected_parsed[1].name.lower() in SYMBOL_DICT:
+                ylabel = latex(SYMBOL_DICT[axes_selected_parsed[1].name.lower()])
             else:
-                if self.data.name.lower() in SYMBOL_DICT:
-                    ylabel = latex(SYMBOL_DICT[self.data.name.lower()])
-                else:
-                    ylabel = latex(self.data.symbol)
-
-                yunit = "[" + latex(output_range["unit"]) + "]"
-
-                if ylabel == "W" and "dBA" in yunit:
-                    ylabel = "ASWL"
-                elif ylabel == "W" and "dB" in yunit:
-                    ylabel = "SWL"
-
-            label = (
-                xlabel
-                + " = "
-                + X_str
-                + " "
-                + xunit
-                + sep
-                + ylabel
-                + " = "
-                + Y_str
-                + " "
-                + yunit
-            )
+                ylabel = latex(axes_selected_parsed[1].name)
+            yunit = "[" + latex(axes_selected_parsed[1].unit) + "]"
+
+        else:
+            if self.data.name.lower() in SYMBOL_DICT:
+                ylabel = latex(SYMBOL_DICT[self.data.name.lower()])
+            else:
+                ylabel = latex(self.data.symbol)
+
+            yunit = "[" + latex(output_range["unit"]) + "]"
+
+            if ylabel == "W" and "dBA" in yunit:
+                ylabel = "ASWL"
+            elif ylabel == "W" and "dB" in yunit:
+                ylabel = "SWL"
 
-            if z is not None:
-                if hasattr(self, "data") and self.data is not None:
-                    zlabel = latex(self.data.symbol)
-                elif self.data._name.lower() in SYMBOL_DICT:
-                    zlabel = latex(SYMBOL_DICT[self.data._name.lower()])
-                else:
-                    zlabel = latex(self.data._name)
-
-                zunit = "[" + latex(self.data.unit) + "]"
-
-                if zlabel == "W" and "dBA" in zunit:
-                    zlabel = "ASWL"
-                elif zlabel == "W" and "dB" in zunit:
-                    zlabel = "SWL"
-
-                label += sep + zlabel + " = " + format(z, ".4g") + " " + zunit
-
-            # Remove latex marks for top right corner
-            if sep == ", ":
-                label = label.replace("$", "").replace("{", "").replace("}", "")
-
-            return label
-
-        # Set cursor
-        ######################################
-        def set_cursor(event):
-            plot_obj = event.artist
-            Z = None
-            legend = None
-            if isinstance(plot_obj, Line2D):
-                ind = event.ind
-                xdata = plot_obj.get_xdata()
-                ydata = plot_obj.get_ydata()
-                X = xdata[ind][0]  # X position of the click
-                Y = ydata[ind][0]  # Y position of the click
-                if self.ax.get_legend_handles_labels()[1] != []:
-                    legend = self.ax.get_legend_handles_labels()[1][
-                        self.ax.lines.index(plot_obj)
-                    ]
-            elif isinstance(plot_obj, PathCollection):
-                ind = event.ind
-                X = plot_obj.get_offsets().data[ind][0][0]
-                Y = plot_obj.get_offsets().data[ind][0][1]
-                if plot_obj.get_array() is not None:
-                    Z = plot_obj.get_array().data[ind][0]
-            elif isinstance(plot_obj, Rectangle):
-                X = plot_obj.get_x() + plot_obj.get_width() / 2
-                Y = plot_obj.get_height()
-            elif isinstance(plot_obj, QuadMesh):
-                ind = event.ind
-                if plot_obj._coordinates.shape[0] > 2:
-                    # pcolormesh case
-                    l = ind[0] // plot_obj._coordinates.shape[1]
-                    X = plot_obj._coordinates[
-                        l, ind[0] - l * plot_obj._coordinates.shape[1] + 1, 0
-                    ]
-                    Y = plot_obj._coordinates[
-                        l, ind[0] - l * plot_obj._coordinates.shape[1] + 1, 1
-                    ]
-                else:
-                    X = (
-                        plot_obj._coordinates[0, ind[0] + 1, 0]
-                        + plot_obj._coordinates[1, ind[0] + 1, 0]
-                    ) / 2
-                    Y = (
-                        plot_obj._coordinates[0, ind[0] + 1, 1]
-                        + plot_obj._coordinates[1, ind[0] + 1, 1]
-                    ) / 2
-                Z = plot_obj.get_array().data[ind[0]]
-
-            # Offset for the label
-            x_min, x_max = self.ax.get_xlim()
-            dx = (x_max - x_min) / 50
-            if X is not None and Y is not None:
-                label = format_coord(X, Y, Z, sep="\n", ind=ind)
-                if legend is not None:
-                    label = legend + "\n" + label
-                if label != "":
-                    if self.text is None:
-                        # Create label in box and black cross
-                        self.text = self.ax.text(
-                            X + dx,
-                            Y,
-                            label,
-                            ha="left",
-                            va="center",
-                            bbox=text_box,
-                        )
-                        # Draw line
-                        self.line = self.ax.plot(
-                            [X, X + dx],
-                            [Y, Y],
-                            color="k",
-                            linestyle="-",
-                            linewidth=0.5,
-                        )
-                        # Draw circle
-                        self.circle = self.ax.plot(
-                            X,
-                            Y,
-                            ".",
-                            markerfacecolor="w",
-                            markeredgecolor="k",
-                            markeredgewidth=0.5,
-                            markersize=12,
-                        )
-                    else:
-                        # Update label, line and circle
-                        self.text._x = X + dx
-                        self.text._y = Y
-                        self.text._text = label
-                        self.circle[0].set_xdata(array(X))
-                        self.circle[0].set_ydata(array(Y))
-                        self.line[0].set_xdata(array([X, X + dx]))
-                        self.line[0].set_ydata(array([Y, Y]))
-
-                    self.ax.texts[-1].set_visible(True)
-                    self.ax.lines[-1].set_visible(True)
-                    self.ax.lines[-2].set_visible(True)
-                    self.canvas.draw()
-
-        def delete_cursor(event):
-            if event.button.name == "RIGHT":
-                if self.text is not None:
-                    self.ax.texts[-1].set_visible(False)
-                if self.line is not None:
-                    self.ax.lines[-1].set_visible(False)
-                if self.circle is not None:
-                    self.ax.lines[-2].set_visible(False)
-            self.canvas.draw()
-
-        self.ax.format_coord = format_coord
-        self.canvas.mpl_connect("pick_event", set_cursor)
-        self.canvas.mpl_connect("button_press_event", delete_cursor)
+        zlabel = latex(self.data.symbol)
+        zunit = "[" + latex(self.data.unit) + "]"
+
+        if zlabel == "W" and "dBA" in zunit:
+            zlabel = "ASWL"
+        elif zlabel == "W" and "dB" in zunit:
+            zlabel = "SWL"
+
+        self._fmt_labels = tuple(
+            strip_latex(s) for s in (xlabel, xunit, ylabel, yunit, zlabel, zunit)
+        )
 
     def update_plot(self):
         """Method that update the plot according to the info selected in the UI
@@ -437,18 +806,6 @@ class DDataPlotter(Ui_DDataPlotter, QWidget):
         # Disabling refresh button after clicking on it (similar to * for an unsaved file)
         self.b_refresh.setDisabled(True)
 
-        # Clear plots
-        for i in reversed(range(self.plot_layout.count())):
-            if self.plot_layout.itemAt(i).widget() is not None:
-                widgetToRemove = self.plot_layout.itemAt(i).widget()
-                widgetToRemove.deleteLater()
-
-        if self.fig.get_axes():
-            self.fig.clear()
-
-        (self.fig, self.ax, _, _) = init_fig()
-        self.set_figure(self.fig)
-
         # Recovering the input of the user
         [
             self.data,
@@ -457,82 +814,241 @@ class DDataPlotter(Ui_DDataPlotter, QWidget):
             output_range,
         ] = self.w_plot_manager.get_plot_info()
 
+        # Skipping the plot if nothing changed since the last one
+        # (the data is stored with the key so that its id can't be reused,
+        # its values modified in place are replotted with the refresh button)
+        plot_key = (
+            id(self.data),
+            tuple(axes_selected),
+            to_hashable(data_selection),
+            to_hashable(output_range),
+            to_hashable(self.plot_arg_dict),
+        )
+        if plot_key == self._last_plot_key and self.data is self._last_plot_data:
+            # Canceling the plot computed in a thread (if any)
+            self._plot_job_id += 1
+            self._pending_plot_key = None
+            self.canvas.draw_idle()
+            return
+        if plot_key == self._pending_plot_key:
+            # Same plot already computed in a thread
+            return
+
         # Checking if the axes are following the order inside the data object
-        axes_selected_parsed = parser.read_input_strings(axes_selected, axis_data=None)
-        axes_name = [ax.name for ax in self.data.get_axes()]
+        axes_selected_parsed = parse_axes(tuple(axes_selected))
+        # Index of each axis of the data (computed once per data)
+        if self._axes_cache is None or self._axes_cache[0] is not self.data:
+            self._axes_cache = (
+                self.data,
+                {ax.name: i for i, ax in enumerate(self.data.get_axes())},
+            )
+        axes_name_idx = self._axes_cache[1]
         not_in_order = False
 
         if len(axes_selected) == 2:
-            if (
-                axes_selected_parsed[0].name in axes_name
-                and axes_selected_parsed[1].name in axes_name
-            ):
-                if axes_name.index(axes_selected_parsed[0].name) > axes_name.index(
-                    axes_selected_parsed[1].name
-                ):
+            name_0 = axes_selected_parsed[0].name
+            name_1 = axes_selected_parsed[1].name
+            if name_0 in axes_name_idx and name_1 in axes_name_idx:
+                if axes_name_idx[name_0] > axes_name_idx[name_1]:
                     not_in_order = True
                     axes_selected = [axes_selected[1], axes_selected[0]]
 
-            elif (
-                axes_selected_parsed[0].name in ifft_dict
-                and axes_selected_parsed[1].name in ifft_dict
-            ):
-                if axes_name.index(
-                    ifft_dict[axes_selected_parsed[0].name]
-                ) > axes_name.index(ifft_dict[axes_selected_parsed[1].name]):
-
+            elif name_0 in ifft_dict and name_1 in ifft_dict:
+                if axes_name_idx[ifft_dict[name_0]] > axes_name_idx[ifft_dict[name_1]]:
                     not_in_order = True
                     axes_selected = [axes_selected[1], axes_selected[0]]
 
-            elif (
-                axes_selected_parsed[0].name in fft_dict
-                and axes_selected_parsed[1].name in fft_dict
-            ):
-                if axes_name.index(
-                    fft_dict[axes_selected_parsed[0].name]
-                ) > axes_name.index(fft_dict[axes_selected_parsed[1].name]):
-
+            elif name_0 in fft_dict and name_1 in fft_dict:
+                if axes_name_idx[fft_dict[name_0]] > axes_name_idx[fft_dict[name_1]]:
                     not_in_order = True
                     axes_selected = [axes_selected[1], axes_selected[0]]
 
+        # Preparing the plot (method, arguments of the plot and of the data computation)
+        plot_job = None
         if not None in data_selection:
+            arg_list = [*axes_selected, *data_selection]
             if len(axes_selected) == 1:
-                plot_arg_dict_2D = self.plot_arg_dict.copy()
-                for param in PARAM_3D:
-                    if param in plot_arg_dict_2D:
-                        del plot_arg_dict_2D[param]
-                self.data.plot_2D_Data(
-                    *[*axes_selected, *data_selection],
-                    **plot_arg_dict_2D,
-                    unit=output_range["unit"],
-                    fig=self.fig,
-                    ax=self.ax,
-                    y_min=output_range["min"],
-                    y_max=output_range["max"],
+                plot_arg_dict_2D = {
+                    k: v for k, v in self.plot_arg_dict.items() if k not in PARAM_3D
+                }
+                plot_job = (
+                    self.data.plot_2D_Data,
+                    arg_list,
+                    dict(
+                        **plot_arg_dict_2D,
+                        unit=output_range["unit"],
+                        y_min=output_range["min"],
+                        y_max=output_range["max"],
+                    ),
+                    dict(
+                        [
+                            (param, plot_arg_dict_2D[param])
+                            for param in PARAM_COMPUTE_2D
+                            if param in plot_arg_dict_2D
+                        ],
+                        unit=output_range["unit"],
+                    ),
                 )
 
             elif len(axes_selected) == 2:
-                plot_arg_dict_3D = self.plot_arg_dict.copy()
-                for param in PARAM_2D:
-                    if param in plot_arg_dict_3D:
-                        del plot_arg_dict_3D[param]
-                if "is_2D_view" not in self.plot_arg_dict:
-                    self.plot_arg_dict["is_2D_view"] = True
-                self.data.plot_3D_Data(
-                    *[*axes_selected, *data_selection],
-                    **plot_arg_dict_3D,
-                    unit=output_range["unit"],
+                plot_arg_dict_3D = {
+                    k: v for k, v in self.plot_arg_dict.items() if k not in PARAM_2D
+                }
+                plot_job = (
+                    self.data.plot_3D_Data,
+                    arg_list,
+                    dict(
+                        **plot_arg_dict_3D,
+                        unit=output_range["unit"],
+                        z_min=output_range["min"],
+                        z_max=output_range["max"],
+                        is_switch_axes=not_in_order,
+                        cast_to=float32,
+                    ),
+                    dict(
+                        [
+                            (param, plot_arg_dict_3D[param])
+                            for param in PARAM_COMPUTE_3D
+                            if param in plot_arg_dict_3D
+                        ],
+                        unit=output_range["unit"],
+                        is_3D=True,
+                    ),
+                )
+
+        # Reusing the data computed for a previous plot if only the display changed
+        self._plot_job_id += 1
+        cache_key = None
+        result_list = None
+        if plot_job is not None:
+            # Clearing the cache when the data changed (e.g. new component of a VectorField)
+            if (
+                self._plot_data_cache_ref is None
+                or self._plot_data_cache_ref() is not self.data
+            ):
+                self._plot_data_cache = dict()
+                self._plot_data_cache_ref = ref(self.data)
+            cache_key = (tuple(plot_job[1]), to_hashable(plot_job[3]))
+            result_list = self._plot_data_cache.get(cache_key)
+        self._plot_job = (
+            plot_job,
+            plot_key,
+            cache_key,
+            axes_selected_parsed,
+            output_range,
+        )
+
+        # Computing the data to plot in a thread (only if displayed, else plotting directly)
+        if plot_job is not None and result_list is None and self.isVisible():
+            self._pending_plot_key = plot_key
+            # Keeping a reference to the worker until the result is received
+            self._plot_worker = PlotWorker(
+                self._plot_job_id,
+                self.data,
+                plot_job[1],
+                plot_job[3],
+                self.get_plot_job_id,
+            )
+            # Bound method of a QWidget: the slot is called in the main thread
+            self._plot_worker.signals.finished.connect(self.draw_plot)
+            self._plot_pool.start(self._plot_worker)
+        else:
+            if plot_job is not None and result_list is None:
+                with set_workers(cpu_count()):
+                    result_list = self.data.compute_plot_data(
+                        *plot_job[1], **plot_job[3]
+                    )
+            self.draw_plot(self._plot_job_id, result_list)
+
+    def force_update_plot(self):
+        """Method that update the plot even if the info selected in the UI didn't change
+        (e.g. values of the data modified in place)
+        Parameters
+        ----------
+        self : DDataPlotter
+            a DDataPlotter object
+
+        """
+        self._last_plot_key = None
+        self._pending_plot_key = None
+        self._plot_data_cache = dict()
+        self.update_plot()
+
+    def get_plot_job_id(self):
+        """Method that return the id of the last plot requested (called by PlotWorker)
+
+        Parameters
+        ----------
+        self : DDataPlotter
+            a DDataPlotter object
+
+        Returns
+        -------
+        job_id : int
+            id of the last plot requested
+        """
+        return self._plot_job_id
+
+    def draw_plot(self, job_id, result_list=None):
+        """Method that draw the plot prepared by update_plot (in the main thread)
+        Parameters
+        ----------
+        self : DDataPlotter
+            a DDataPlotter object
+        job_id : int
+            id of the plot request (results of outdated requests are ignored)
+        result_list : list
+            output of compute_plot_data (computed by the plot method if None)
+        """
+        if job_id != self._plot_job_id:
+            return
+        (
+            plot_job,
+            plot_key,
+            cache_key,
+            axes_selected_parsed,
+            output_range,
+        ) = self._plot_job
+        self._pending_plot_key = None
+        self._plot_worker = None
+
+        # Storing the data computed (the oldest plot is removed from the cache)
+        if result_list is not None and cache_key not in self._plot_data_cache:
+            if len(self._plot_data_cache) >= N_PLOT_CACHE:
+                del self._plot_data_cache[next(iter(self._plot_data_cache))]
+            self._plot_data_cache[cache_key] = result_list
+        self.update_coord_labels(axes_selected_parsed, output_range)
+
+        # Clear plots (a new Axes is needed as colorbars are removed with the figure)
+        self.fig.clf()
+        self.ax = self.fig.add_subplot(1, 1, 1)
+        self.ax.format_coord = self.format_coord
+        self.circle = None
+        self.line = None
+        self._pending_cursor = None
+        self.cursor_label.hide()
+        self._bg = None
+
+        if plot_job is not None:
+            plot_method, arg_list, plot_kwargs, _ = plot_job
+            # Using all the cores for the FFTs (if computed by the plot method)
+            with set_workers(cpu_count()):
+                plot_method(
+                    *arg_list,
+                    **plot_kwargs,
                     fig=self.fig,
                     ax=self.ax,
-                    z_min=output_range["min"],
-                    z_max=output_range["max"],
-                    is_switch_axes=not_in_order,
+                    result_list=result_list,
                 )
-
         else:
             print("Operation not implemented yet, plot could not be updated")
 
-        self.w_plot_manager.w_range.set_min_max()
+        self.w_plot_manager.w_range.set_min_max(fig=self.fig)
+        self.update_coord_cache()
+        self.canvas.draw_idle()
+
+        self._last_plot_key = plot_key
+        self._last_plot_data = self.data
 
     def set_info(
         self,
@@ -553,7 +1069,14 @@ class DDataPlotter(Ui_DDataPlotter, QWidget):
             Dictionnary with arguments that must be given to the plot
         """
 
+        if plot_arg_dict is not None and "is_2D_view" not in plot_arg_dict:
+            plot_arg_dict = dict(plot_arg_dict, is_2D_view=True)
         self.plot_arg_dict = plot_arg_dict
+        self._last_plot_key = None
+        self._last_plot_data = None
+        self._plot_data_cache = dict()
+        self._plot_data_cache_ref = None
+        self._axes_cache = None
 
         self.w_plot_manager.set_info(
             data=data,
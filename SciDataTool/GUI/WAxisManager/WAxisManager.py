@@ -1,4 +1,4 @@
-from PySide2.QtWidgets import QSpacerItem, QWidget
+from PySide2.QtWidgets import QWidget
 from PySide2.QtCore import Signal
 
 from SciDataTool.GUI.WAxisManager.Ui_WAxisManager import Ui_WAxisManager
@@ -43,6 +43,9 @@ class WAxisManager(Ui_WAxisManager, QWidget):
         self.setupUi(self)
 
         self.axes_list = list()
+        self.w_slice_op = list()
+        # WSliceOperator widgets already generated (hidden when not used), key = axis name
+        self.slice_op_pool = dict()
 
         # Managing the signal emitted by the WAxisSelector widgets
         self.w_axis_1.axisChanged.connect(self.axis_1_updated)
@@ -89,29 +92,31 @@ class WAxisManager(Ui_WAxisManager, QWidget):
         """
 
         # Step 1 : Recovering the axis that must be generated (those that are not selected)
-        # Getting all the possible axes
-        axes_list_1 = self.w_axis_1.get_axes_name()[:]
-        axes_list_2 = self.w_axis_2.get_axes_name()[:]
-
-        # Getting the axes selected and removing them from the right axes_list
-        axis_selected_1 = self.w_axis_1.get_axis_selected()
-        axis_selected_2 = self.w_axis_2.get_axis_selected()
-
-        axes_list_1.remove(axis_selected_1)
-        if axis_selected_2 in axes_list_2:
-            axes_list_2.remove(axis_selected_2)
-
-        # Selecting the axes that are in common between the two axes lists
-        axes_gen = list()
-        axes_gen = [ax for ax in axes_list_1 if ax in axes_list_2]
+        # Getting the axes selected
+        axes_selected = {
+            self.w_axis_1.get_axis_selected(),
+            self.w_axis_2.get_axis_selected(),
+        }
+
+        # Selecting the axes available in both WAxisSelector that are not selected
+        axes_list_2 = set(self.w_axis_2.get_axes_name())
+        axes_gen = [
+            ax
+            for ax in self.w_axis_1.get_axes_name()
+            if ax not in axes_selected and ax in axes_list_2
+        ]
 
         for ax in self.axes_list:
             if ax.is_overlay:
                 axes_gen.append(ax.name)
 
-        # Step 2 : Removing the items that are in the layout currently
-        for i in reversed(range(self.lay_data_extract.count())):
-            self.lay_data_extract.takeAt(i).widget().setParent(None)
+        # Blocking the repaint of the groupBox until all the widgets are generated
+        self.setUpdatesEnabled(False)
+        self.g_data_extract.setUpdatesEnabled(False)
+
+        # Step 2 : Removing the items that are in the layout currently (kept in the pool)
+        while self.lay_data_extract.count():
+            self.lay_data_extract.takeAt(0).widget().hide()
 
         # Step 3 : For each axis available, adding a WSliceOperator widget inside the layout
         # If there are no slice to do (two axis available and selected before) then we hide the groupBox
@@ -120,8 +125,15 @@ class WAxisManager(Ui_WAxisManager, QWidget):
             self.w_slice_op = list()
 
             for axis in axes_gen:
-                temp = WSliceOperator(self.g_data_extract)
-                temp.setObjectName(axis)
+                if axis in self.slice_op_pool:
+                    temp = self.slice_op_pool[axis]
+                else:
+                    temp = WSliceOperator(self.g_data_extract)
+                    temp.setObjectName(axis)
+                    temp.refreshNeeded.connect(self.update_needed)
+                    self.slice_op_pool[axis] = temp
+                # The refresh is requested once all the widgets are generated
+                # (refreshNeeded is blocked in WSliceOperator.update)
                 for ax in self.axes_list:
                     if (
                         ax.name == axis
@@ -131,13 +143,17 @@ class WAxisManager(Ui_WAxisManager, QWidget):
                         and ax.name in rev_axes_dict[axis]
                     ):
                         temp.update(ax)
-                temp.refreshNeeded.connect(self.update_needed)
                 self.w_slice_op.append(temp)
                 self.lay_data_extract.addWidget(temp)
+                temp.show()
 
         else:
             self.w_slice_op = list()
             self.g_data_extract.hide()
+
+        self.g_data_extract.setUpdatesEnabled(True)
+        self.setUpdatesEnabled(True)
+        self.update()
         self.update_needed()
 
     def get_axes_selected(self):
@@ -224,6 +240,15 @@ class WAxisManager(Ui_WAxisManager, QWidget):
                     wid.update_floatEdit(is_refresh=False)
 
         else:
+            # Step 0 : New data, the WSliceOperator widgets of the previous data are not reused
+            # (values, operations and frozen state of the previous axes)
+            while self.lay_data_extract.count():
+                self.lay_data_extract.takeAt(0).widget().hide()
+            for wid in self.slice_op_pool.values():
+                wid.deleteLater()
+            self.slice_op_pool = dict()
+            self.w_slice_op = list()
+
             # Step 1 : If only one axis is given with the object, then we hide w_axis_2 and g_data_extract
             # We also have to hide if we have more than one axis but one have is_overlay = True
             if len(data.get_axes()) == 1 or (
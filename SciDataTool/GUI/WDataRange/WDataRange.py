@@ -50,19 +50,22 @@ class WDataRange(Ui_WDataRange, QWidget):
             "max": self.lf_max.value(),
         }
 
-    def set_min_max(self):
+    def set_min_max(self, fig=None):
         """Method that will set the FloatEdit of the widget that are responsible for the min value and for the max value.
         Parameters
         ----------
         self : WDataRange
             a WDataRange object
+        fig : Figure
+            figure to get the limits from (current figure if None)
         """
 
         field_min = None
         field_max = None
 
         # Get limits from figure
-        fig = plt.gcf()
+        if fig is None:
+            fig = plt.gcf()
         if fig is not None:
             if len(fig.axes) == 1:
                 field_min = fig.axes[0].get_ylim()[0]
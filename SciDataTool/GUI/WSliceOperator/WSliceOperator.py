@@ -1,11 +1,22 @@
 from PySide2.QtWidgets import QWidget
 
 from SciDataTool.GUI.WSliceOperator.Ui_WSliceOperator import Ui_WSliceOperator
-from PySide2.QtCore import Signal
+from PySide2.QtCore import Signal, QSignalBlocker
 from SciDataTool.Functions.Plot import axes_dict, fft_dict, ifft_dict, unit_dict
 from SciDataTool.Classes.Data import Data
-from numpy import where
-from numpy import argmin, abs as np_abs
+from numpy import (
+    argmin,
+    abs as np_abs,
+    ascontiguousarray,
+    float64,
+    diff,
+    searchsorted,
+)
+
+try:
+    from numba import njit, int64, float64 as nb_float64
+except ImportError:
+    njit = None
 
 type_extraction_dict = {
     "max": "=max",
@@ -28,6 +39,85 @@ OPERATION_LIST = [
     "overlay",
 ]
 
+# Operations available for each kind of axis: (is_overlay, is_components, is_fft)
+# slice is removed for string axes, overlay for the axes which are not components
+# and slice (fft) for the axes without fft
+OPERATION_TABLE = {
+    (is_overlay, is_components, is_fft): tuple(
+        op
+        for op in OPERATION_LIST
+        if not (op == "slice" and is_overlay)
+        and not (op == "overlay" and not is_overlay and not is_components)
+        and not (op == "slice (fft)" and not is_fft)
+    )
+    for is_overlay in (True, False)
+    for is_components in (True, False)
+    for is_fft in (True, False)
+}
+
+# Names of the axes with a translation/fft, for the membership tests done at each update
+AXES_KEYS = frozenset(axes_dict)
+FFT_KEYS = frozenset(fft_dict)
+IFFT_KEYS = frozenset(ifft_dict)
+
+
+if njit is not None:
+
+    @njit(int64(nb_float64[::1], nb_float64), cache=True)
+    def nearest_index(axis_value, value):
+        """Return the index of the closest value in a sorted array (compiled with numba)
+
+        Parameters
+        ----------
+        axis_value : ndarray
+            sorted contiguous float64 array
+        value : float
+            value to look for
+
+        Returns
+        -------
+        index : int
+            index of the closest value (lower one if equal)
+        """
+        # Binary search of the first value >= value (as searchsorted)
+        lo = 0
+        hi = axis_value.shape[0]
+        while lo < hi:
+            mid = (lo + hi) >> 1
+            if axis_value[mid] < value:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo == axis_value.shape[0]:
+            return lo - 1
+        if lo > 0 and value - axis_value[lo - 1] <= axis_value[lo] - value:
+            return lo - 1
+        return lo
+
+else:
+
+    def nearest_index(axis_value, value):
+        """Return the index of the closest value in a sorted array
+
+        Parameters
+        ----------
+        axis_value : ndarray
+            sorted contiguous float64 array
+        value : float
+            value to look for
+
+        Returns
+        -------
+        index : int
+            index of the closest value (lower one if equal)
+        """
+        index = searchsorted(axis_value, value)
+        if index == axis_value.size:
+            return index - 1
+        if index > 0 and value - axis_value[index - 1] <= axis_value[index] - value:
+            return index - 1
+        return index
+
 
 class WSliceOperator(Ui_WSliceOperator, QWidget):
     """Widget to define how to handle the 'non-plot' axis"""
@@ -50,6 +140,14 @@ class WSliceOperator(Ui_WSliceOperator, QWidget):
         self.setupUi(self)
         self.name = "angle"
         self.axis = Data
+        # The values of the axis are only recomputed if the axis or the operation changed
+        self._axis_values_dirty = True
+        self._last_op = None
+        # Values of the axis for each slice operation (reset when the axis changes)
+        self._gv_cache = dict()
+        # Bounds of the values of the axis (set with the values)
+        self._axis_min = None
+        self._axis_max = None
 
         self.c_operation.currentTextChanged.connect(self.update_layout)
         self.slider.valueChanged.connect(self.update_floatEdit)
@@ -81,7 +179,7 @@ class WSliceOperator(Ui_WSliceOperator, QWidget):
             # slice_index = self.slider.value()
             # action = "[" + str(slice_index) + "]"
             action = "=" + str(self.lf_value.value())
-            if self.axis_name in fft_dict:
+            if self.axis_name in FFT_KEYS:
                 return fft_dict[self.axis_name] + action
 
         elif action_type == "overlay":
@@ -126,7 +224,7 @@ class WSliceOperator(Ui_WSliceOperator, QWidget):
             string that hold the name of the axis
         """
         # Checking if the name of the axis is the name as the one displayed (z =/= axial direction for example)
-        if name in axes_dict:
+        if name in AXES_KEYS:
             self.in_name.setText(axes_dict[name])
         else:
             self.in_name.setText(name)
@@ -188,38 +286,80 @@ class WSliceOperator(Ui_WSliceOperator, QWidget):
         self : WSliceOperator
             a WSliceOperator object
         """
-        # Converting the axis from rad to degree if the axis is angle as we do slice in degrees
-        # Recovering the value from the axis as well
-        if self.c_operation.currentText() == "slice":
-            if self.axis.name in ifft_dict:
-                operation = self.axis.name + "_to_" + self.axis_name
-            else:
-                operation = None
-            if self.axis_name == "angle":
-                self.axis_value = self.axis.get_values(
-                    unit="°", operation=operation, corr_unit="rad", is_full=True
-                )
-                self.unit = "°"
-            else:
-                self.axis_value = self.axis.get_values(
-                    operation=operation, is_full=True
+        # Skipping the second call of update (same axis and same operation)
+        operation_selected = self.c_operation.currentText()
+        if not self._axis_values_dirty and self._last_op == operation_selected:
+            return
+
+        if operation_selected in self._gv_cache:
+            # Values already computed for this axis and operation
+            (
+                self.axis_value,
+                self._sorted,
+                self._axis_min,
+                self._axis_max,
+            ) = self._gv_cache[operation_selected]
+        else:
+            # Converting the axis from rad to degree if the axis is angle as we do slice in degrees
+            # Recovering the value from the axis as well
+            if operation_selected == "slice":
+                if self.axis.name in IFFT_KEYS:
+                    operation = self.axis.name + "_to_" + self.axis_name
+                else:
+                    operation = None
+                if self.axis_name == "angle":
+                    self.axis_value = self.axis.get_values(
+                        unit="°", operation=operation, corr_unit="rad", is_full=True
+                    )
+                    self.unit = "°"
+                else:
+                    self.axis_value = self.axis.get_values(
+                        operation=operation, is_full=True
+                    )
+            elif operation_selected == "slice (fft)":
+                if self.axis.name == "angle":
+                    self.axis_value = self.axis.get_values(
+                        operation="angle_to_wavenumber"
+                    )
+                elif self.axis.name == "time":
+                    self.axis_value = self.axis.get_values(operation="time_to_freqs")
+                else:  # already wavenumber of freqs case
+                    self.axis_value = self.axis.get_values()
+
+            # Storing the values as a contiguous float64 array (fast search of the closest value)
+            try:
+                self.axis_value = ascontiguousarray(self.axis_value, dtype=float64)
+                self._sorted = bool((diff(self.axis_value) >= 0).all())
+                if self._sorted:
+                    self._axis_min = self.axis_value[0]
+                    self._axis_max = self.axis_value[-1]
+                else:
+                    self._axis_min = self.axis_value.min()
+                    self._axis_max = self.axis_value.max()
+            except (TypeError, ValueError):  # string axis
+                self._sorted = False
+                self._axis_min = min(self.axis_value)
+                self._axis_max = max(self.axis_value)
+
+            if operation_selected in ["slice", "slice (fft)"]:
+                self._gv_cache[operation_selected] = (
+                    self.axis_value,
+                    self._sorted,
+                    self._axis_min,
+                    self._axis_max,
                 )
-        elif self.c_operation.currentText() == "slice (fft)":
-            if self.axis.name == "angle":
-                self.axis_value = self.axis.get_values(operation="angle_to_wavenumber")
-            elif self.axis.name == "time":
-                self.axis_value = self.axis.get_values(operation="time_to_freqs")
-            else:  # already wavenumber of freqs case
-                self.axis_value = self.axis.get_values()
 
         # Setting the initial value of the floatEdit to the minimum inside the axis
-        self.lf_value.setValue(min(self.axis_value))
+        self.lf_value.setValue(self._axis_min)
 
         # Setting the slider by giving the number of index according to the size of the axis
         self.slider.setMinimum(0)
         self.slider.setMaximum(len(self.axis_value) - 1)
         self.slider.setValue(0)
 
+        self._axis_values_dirty = False
+        self._last_op = operation_selected
+
     def update(self, axis):
         """Method that will update the WSliceOperator widget according to the axis given to it
         Parameters
@@ -229,34 +369,43 @@ class WSliceOperator(Ui_WSliceOperator, QWidget):
         axis : string
             string with the name of the axis that should set the WSliceOperator widget
         """
+        # Single repaint and no refreshNeeded/currentTextChanged while the widget is set
+        # (the refresh is requested by WAxisManager once all the widgets are updated)
+        self.setUpdatesEnabled(False)
+        blocker = QSignalBlocker(self)
+        blocker_op = QSignalBlocker(self.c_operation)
+
         self.axis = axis
         self.unit = axis.unit
-        if axis.name in ifft_dict:  # DataFreq case
+        self._axis_values_dirty = True
+        self._last_op = None
+        self._gv_cache = dict()
+        if axis.name in IFFT_KEYS:  # DataFreq case
             self.axis_name = ifft_dict[axis.name]
         else:
             self.axis_name = axis.name
         self.set_name(self.axis_name)
 
-        self.c_operation.blockSignals(True)
-        operation_list = OPERATION_LIST.copy()
-
-        # Remove slice for string axes
-        if self.axis.is_overlay:
-            operation_list.remove("slice")
-        elif not self.axis.is_components:
-            operation_list.remove("overlay")
-            self.set_slider_floatedit()
-
-        # Remove fft slice for non fft axes
-        if not self.axis_name in fft_dict:
-            operation_list.remove("slice (fft)")
+        is_overlay = bool(self.axis.is_overlay)
+        is_components = bool(self.axis.is_components)
+        operation_list = OPERATION_TABLE[
+            (is_overlay, is_components, self.axis_name in FFT_KEYS)
+        ]
 
         self.c_operation.clear()
         self.c_operation.addItems(operation_list)
-        if self.axis.is_components:
+        if is_components:
             self.c_operation.setCurrentIndex(operation_list.index("overlay"))
+
+        # Values of the axis for the operation of the new combobox (not the previous one)
+        if not is_overlay and not is_components:
+            self.set_slider_floatedit()
         self.update_layout()
-        self.c_operation.blockSignals(False)
+
+        blocker_op.unblock()
+        blocker.unblock()
+        # Enabling the updates again repaints the widget
+        self.setUpdatesEnabled(True)
 
     def update_floatEdit(self, is_refresh=True):
         """Method that set the value of the floatEdit according to the value returned by the slider
@@ -294,12 +443,15 @@ class WSliceOperator(Ui_WSliceOperator, QWidget):
             self.refreshNeeded.emit()
         # If the operation selected is overlay then we show the related button
         elif extraction_selected == "overlay":
+            self._axis_values_dirty = True
             self.lf_value.hide()
             self.slider.hide()
             # self.b_action.show()
             # self.b_action.setText(extraction_selected)
             self.refreshNeeded.emit()
         else:
+            # The slider is set again when coming back to a slice
+            self._axis_values_dirty = True
             self.lf_value.hide()
             self.slider.hide()
             self.b_action.hide()
@@ -316,7 +468,18 @@ class WSliceOperator(Ui_WSliceOperator, QWidget):
 
         self.slider.blockSignals(True)
         # We set the value of the slider to the index closest to the value given
-        index = argmin(np_abs(self.axis_value - self.lf_value.value()))
+        value = self.lf_value.value()
+        if self._sorted:
+            # Values outside of the axis: first or last index, else binary search
+            # (the closest of the two neighbors is kept)
+            if value <= self._axis_min:
+                index = 0
+            elif value >= self._axis_max:
+                index = len(self.axis_value) - 1
+            else:
+                index = nearest_index(self.axis_value, value)
+        else:
+            index = argmin(np_abs(self.axis_value - value))
         self.slider.setValue(index)
         # We update the value of floatEdit to the index selected
         self.lf_value.setValue(self.axis_value[index])
@@ -0,0 +1,102 @@
+from SciDataTool.Functions.fix_axes_order import fix_axes_order
+
+
+def compute_plot_data(
+    self,
+    *arg_list,
+    axis_data=None,
+    is_norm=False,
+    unit="SI",
+    data_list=[],
+    is_3D=False,
+    is_2D_view=True,
+    N_stem=100,
+    type_plot=None,
+):
+    """Extracts the fields and axes plotted by plot_2D_Data/plot_3D_Data (no matplotlib call)
+
+    Parameters
+    ----------
+    self : DataND
+        a DataND object
+    *arg_list : list of str
+        arguments to specify which axes to plot
+    axis_data : list
+        list of ndarray corresponding to user-input data
+    is_norm : bool
+        boolean indicating if the field must be normalized
+    unit : str
+        unit in which to plot the field
+    data_list : list
+        list of Data objects to compare (plot_2D_Data only)
+    is_3D : bool
+        True to extract the data of plot_3D_Data, else plot_2D_Data
+    is_2D_view : bool
+        True to plot Data in xy plane and put z as colormap (plot_3D_Data only)
+    N_stem : int
+        number of harmonics to plot (plot_3D_Data stem plots only)
+    type_plot : str
+        type of 2D graph (plot_2D_Data only)
+
+    Returns
+    -------
+    result_list : list
+        list of the dict returned by the extraction for self and each Data of data_list
+    """
+
+    if len(arg_list) == 1 and type(arg_list[0]) == tuple:
+        arg_list = arg_list[0]  # if called from another script with *arg_list
+
+    # Fix axes order
+    arg_list_along = fix_axes_order([axis.name for axis in self.get_axes()], arg_list)
+
+    # Set unit
+    if unit == "SI":
+        unit = self.unit
+
+    # Detect fft
+    is_fft = any("wavenumber" in s for s in arg_list) or any(
+        "freqs" in s for s in arg_list
+    )
+
+    if is_3D:
+        if is_fft:
+            if is_2D_view:
+                result = self.get_magnitude_along(
+                    *arg_list_along, axis_data=axis_data, unit=unit, is_norm=is_norm
+                )
+            else:
+                result = self.get_harmonics(
+                    N_stem,
+                    *arg_list_along,
+                    axis_data=axis_data,
+                    unit=unit,
+                    is_norm=is_norm,
+                    is_flat=True,
+                )
+        else:
+            result = self.get_along(*arg_list_along, unit=unit, is_norm=is_norm)
+        return [result]
+
+    # In case of 1D fft, keep only positive wavenumbers
+    for i, arg in enumerate(arg_list_along):
+        if "wavenumber" in arg and "=" not in arg and "[" not in arg:
+            liste = list(arg_list_along)
+            liste[i] = arg.replace("wavenumber", "wavenumber>0")
+            arg_list_along = tuple(liste)
+
+    is_fft = is_fft and type_plot != "curve"
+
+    result_list = []
+    for d in [self] + data_list:
+        if is_fft or "dB" in unit:
+            result = d.get_magnitude_along(
+                *arg_list_along, axis_data=axis_data, unit=unit, is_norm=is_norm
+            )
+        else:
+            result = d.get_along(
+                *arg_list_along, axis_data=axis_data, unit=unit, is_norm=is_norm
+            )
+        result_list.append(result)
+
+    return result_list
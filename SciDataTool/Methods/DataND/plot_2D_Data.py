@@ -8,7 +8,6 @@ from SciDataTool.Functions.Plot import (
     COLORS,
 )
 from SciDataTool.Functions.Load.import_class import import_class
-from SciDataTool.Functions.fix_axes_order import fix_axes_order
 from SciDataTool.Functions.parser import read_input_strings
 from SciDataTool.Classes.Norm_indices import Norm_indices
 from numpy import (
@@ -69,6 +68,7 @@ def plot_2D_Data(
     is_outside_legend=False,
     is_frame_legend=True,
     is_indlabels=False,
+    result_list=None,
 ):
     """Plots a field as a function of time
 
@@ -130,6 +130,8 @@ def plot_2D_Data(
         True to display legend outside the graph
     is_frame_legend : bool
         True to display legend in a frame
+    result_list : list
+        output of compute_plot_data (computed if None)
     """
 
     # Dynamic import to avoid import loop
@@ -143,16 +145,6 @@ def plot_2D_Data(
         axis.name for axis in read_input_strings(arg_list, axis_data=axis_data)
     ]
 
-    # Fix axes order
-    arg_list_along = fix_axes_order([axis.name for axis in self.get_axes()], arg_list)
-
-    # In case of 1D fft, keep only positive wavenumbers
-    for i, arg in enumerate(arg_list_along):
-        if "wavenumber" in arg and "=" not in arg and "[" not in arg:
-            liste = list(arg_list_along)
-            liste[i] = arg.replace("wavenumber", "wavenumber>0")
-            arg_list_along = tuple(liste)
-
     if color_list == [] or color_list is None:
         color_list = COLORS
 
@@ -210,23 +202,22 @@ def plot_2D_Data(
     Xdatas = []
     Ydatas = []
     data_list2 = [self] + data_list
+    if result_list is None:
+        result_list = self.compute_plot_data(
+            *arg_list,
+            axis_data=axis_data,
+            is_norm=is_norm,
+            unit=unit,
+            data_list=data_list,
+            type_plot=type_plot,
+        )
     for i, d in enumerate(data_list2):
-        if is_fft or "dB" in unit:
-            result = d.get_magnitude_along(
-                *arg_list_along, axis_data=axis_data, unit=unit, is_norm=is_norm
-            )
-            if i == 0:
-                axes_list = result.pop("axes_list")
-                axes_dict_other = result.pop("axes_dict_other")
-                result_0 = result
-        else:
-            result = d.get_along(
-                *arg_list_along, axis_data=axis_data, unit=unit, is_norm=is_norm
-            )
-            if i == 0:
-                axes_list = result.pop("axes_list")
-                axes_dict_other = result.pop("axes_dict_other")
-                result_0 = result
+        # Copy to keep result_list unchanged
+        result = result_list[i].copy()
+        if i == 0:
+            axes_list = result.pop("axes_list")
+            axes_dict_other = result.pop("axes_dict_other")
+            result_0 = result
         Ydatas.append(result.pop(d.symbol))
         # in string case not overlay, Xdatas is a linspace
         if (
@@ -497,9 +488,8 @@ def plot_2D_Data(
         color_list.insert(0, "#000000")
         legends.insert(0, "Overall")
 
-    if "dB" in unit:  # Replace <=0 by nans
-        for ydata in Ydatas:
-            ydata[ydata <= 0] = nan
+    if "dB" in unit:  # Replace <=0 by nans (not in place to keep result_list unchanged)
+        Ydatas = [where(ydata <= 0, nan, ydata) for ydata in Ydatas]
 
     # Call generic plot function
     if is_fft:
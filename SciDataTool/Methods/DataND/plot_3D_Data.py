@@ -4,7 +4,6 @@ from SciDataTool.Functions.Plot.plot_3D import plot_3D
 from SciDataTool.Functions.Plot import unit_dict, norm_dict, axes_dict
 from SciDataTool.Functions.Load.import_class import import_class
 from SciDataTool.Functions.parser import read_input_strings
-from SciDataTool.Functions.fix_axes_order import fix_axes_order
 from SciDataTool.Classes.Norm_indices import Norm_indices
 from numpy import (
     any as np_any,
@@ -62,6 +61,8 @@ def plot_3D_Data(
     type_plot=None,
     annotation_delim=None,
     marker_color="k",
+    result_list=None,
+    cast_to=None,
 ):
     """Plots a field as a function of two axes
 
@@ -119,6 +120,10 @@ def plot_3D_Data(
         threshold for automatic fft ticks
     is_switch_axes : bool
         to switch x and y axes
+    result_list : list
+        output of compute_plot_data (computed if None)
+    cast_to : dtype
+        dtype of the field plotted, for all the types of plot (e.g. float32 to speed up pcolormesh)
     """
 
     # Dynamic import to avoid import loop
@@ -131,9 +136,6 @@ def plot_3D_Data(
         axis.name for axis in read_input_strings(arg_list, axis_data=axis_data)
     ]
 
-    # Fix axes order
-    arg_list_along = fix_axes_order([axis.name for axis in self.get_axes()], arg_list)
-
     # Set unit
     if unit == "SI":
         unit = self.unit
@@ -168,22 +170,17 @@ def plot_3D_Data(
                     zlabel = r"$" + self.symbol + "$ " + unit_str
 
     # Extract field and axes
-    if is_fft:
-        if is_2D_view:
-            result = self.get_magnitude_along(
-                *arg_list_along, axis_data=axis_data, unit=unit, is_norm=is_norm
-            )
-        else:
-            result = self.get_harmonics(
-                N_stem,
-                *arg_list_along,
-                axis_data=axis_data,
-                unit=unit,
-                is_norm=is_norm,
-                is_flat=True,
-            )
-    else:
-        result = self.get_along(*arg_list_along, unit=unit, is_norm=is_norm)
+    if result_list is None:
+        result_list = self.compute_plot_data(
+            *arg_list,
+            axis_data=axis_data,
+            is_norm=is_norm,
+            unit=unit,
+            is_3D=True,
+            is_2D_view=is_2D_view,
+            N_stem=N_stem,
+        )
+    result = result_list[0]
 
     if type_plot == "scatter" and not is_fft:
         is_fft = True
@@ -387,6 +384,10 @@ def plot_3D_Data(
         title = title1 + title2 + title3
         title = title.rstrip(", ")
 
+    # Casting the field for all the types of plot (colormaps, scatter and stem)
+    if cast_to is not None:
+        Zdata = Zdata.astype(cast_to, copy=False)
+
     if is_fft:
 
         if thresh is None: